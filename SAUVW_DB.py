@@ -5,22 +5,105 @@ Date: May 13, 2025 (Re-verified)
 Description: Streamlit dashboard for the Text Mined Crystal Structure Database of Superconductors.
 """
 
+import os
+import uuid
+
 import streamlit as st
 import pandas as pd
 from pathlib import Path
 
+ROOT = Path(__file__).resolve().parent
+CS_CSV = ROOT / "SAUVW_full_crysdata.csv"
+BENCHMARK_CSV = ROOT / "SAUVW_Benchmark.csv"
+PAGE_SIZE = 50
+# Bump whenever load_csv's output changes so stale Parquet caches are ignored.
+PARQUET_CACHE_VERSION = 1
+
+
+@st.cache_data(show_spinner=False)
+def load_csv(path: str, mtime: float) -> pd.DataFrame:
+    """Read a CSV once per file version; `mtime` invalidates the cache on edits.
+
+    A versioned Parquet copy is written next to the CSV on first load and read
+    on later cold starts, falling back to the CSV if it is missing, stale,
+    unreadable or cannot be written.
+    """
+    csv_path = Path(path)
+    pq_path = csv_path.with_name(f"{csv_path.stem}.v{PARQUET_CACHE_VERSION}.parquet")
+    if pq_path.exists() and pq_path.stat().st_mtime >= mtime:
+        try:
+            return pd.read_parquet(pq_path, engine="pyarrow")
+        except (OSError, ValueError):
+            pass
+    df = pd.read_csv(csv_path)
+    _write_parquet_atomic(df, pq_path)
+    return df
+
+
+def _write_parquet_atomic(df: pd.DataFrame, pq_path: Path) -> None:
+    """Write `df` via a temp file and rename, so readers never see a partial file.
+
+    The temp file is created by `to_parquet` itself, so it gets the process's
+    normal umask-derived mode rather than tempfile's owner-only 0600.
+    """
+    tmp_path = pq_path.with_name(f".{pq_path.stem}.{os.getpid()}.{uuid.uuid4().hex}.parquet")
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow", index=False)
+        os.replace(tmp_path, pq_path)
+    except (OSError, ValueError):
+        tmp_path.unlink(missing_ok=True)
+
+
+@st.cache_data(show_spinner=False)
+def load_bytes(path: str, mtime: float) -> bytes:
+    """Raw file contents for the download buttons, cached per file version."""
+    return Path(path).read_bytes()
+
+
+def show_paginated(
+    df: pd.DataFrame, key: str, csv_path: Path, page_size: int = PAGE_SIZE
+) -> None:
+    """Render one page of `df` so each rerun only serializes `page_size` rows.
+
+    Sorting and search in the table apply to the current page; the download
+    button always serves the complete CSV.
+    """
+    st.download_button(
+        f"⬇️ Download full {csv_path.name} ({len(df)} rows)",
+        data=load_bytes(str(csv_path), csv_path.stat().st_mtime),
+        file_name=csv_path.name,
+        mime="text/csv",
+        key=f"{key}_download",
+    )
+    if len(df) == 0:
+        st.info("No rows to display.")
+        return
+    n_pages = -(-len(df) // page_size)
+    page = st.number_input(
+        f"Page (1–{n_pages})", min_value=1, max_value=n_pages, value=1, step=1, key=key
+    )
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+    st.caption(
+        f"Rows {start + 1}–{min(start + page_size, len(df))} of {len(df)}. "
+        "Sorting and search apply to this page only; use the download button "
+        "for the full table."
+    )
+
+
 # Page configuration
 st.set_page_config(
     page_title="Text Mined Crystal Structure Database of Superconductors",
     layout="wide",
 )
 
-# --- Try loading logo if exists ---
-logo_path = None
-for name in ["SAUVW.png"]:
-    if Path(name).exists():
-        logo_path = name
-        break
+# --- Try loading logo if exists (looked up once per session) ---
+if "logo_path" not in st.session_state:
+    logo_names = {"sauvw.png"}
+    st.session_state["logo_path"] = next(
+        (str(p) for p in ROOT.iterdir() if p.name.lower() in logo_names), None
+    )
+logo_path = st.session_state["logo_path"]
 
 # Header section
 col1, col2 = st.columns([1, 6])
@@ -70,18 +153,18 @@ st.divider()
 
 # --- Load data ---
 try:
-    data_cs_f = pd.read_csv("SAUVW_full_crysdata.csv")
+    data_cs_f = load_csv(str(CS_CSV), CS_CSV.stat().st_mtime)
     st.header("📘 Full Crystal Data – SAUVW_full_crysdata.csv")
-    st.dataframe(data_cs_f, use_container_width=True)
+    show_paginated(data_cs_f, key="page_cs", csv_path=CS_CSV)
 except Exception as e:
     st.error(f"Could not load SAUVW_full_crysdata.csv: {e}")
 
 st.divider()
 
 try:
-    data_benchmark = pd.read_csv("SAUVW_Benchmark.csv")
+    data_benchmark = load_csv(str(BENCHMARK_CSV), BENCHMARK_CSV.stat().st_mtime)
     st.header("📗 Benchmark Results – SAUVW_Benchmark.csv")
-    st.dataframe(data_benchmark, use_container_width=True)
+    show_paginated(data_benchmark, key="page_benchmark", csv_path=BENCHMARK_CSV)
 except Exception as e:
     st.error(f"Could not load SAUVW_Benchmark.csv: {e}")
 